@@ -4,13 +4,13 @@ Multi-source open mic aggregator.
 Combines events from multiple sources, deduplicates, and filters by distance.
 """
 
-import json
+import asyncio
+import sys
+from collections import defaultdict
 from pathlib import Path
 from typing import List, Optional
 
 from .models.event import OpenMicEvent
-from .scrapers.openmic_us import OpenMicUSScraper
-from .scrapers.eventbrite import EventbriteScraper
 from .geo import filter_by_distance, get_city_coords
 
 
@@ -18,22 +18,38 @@ class OpenMicAggregator:
     """Aggregates open mic events from multiple sources."""
 
     def __init__(self, config_path: Optional[str] = None):
+        # Scrapers (and the HTTP/HTML stacks behind them) are imported here
+        # rather than at module load, so early CLI exits stay cheap
+        from .scrapers.base import BaseScraper, _cached_load_config
+        from .scrapers.eventbrite import EventbriteScraper
+        from .scrapers.openmic_us import OpenMicUSScraper
+
         if config_path is None:
             config_path = Path(__file__).parent / "config" / "credentials.json"
         else:
             config_path = Path(config_path)
 
-        self.config = {}
-        if config_path.exists():
-            with open(config_path) as f:
-                self.config = json.load(f)
+        self.config = _cached_load_config(str(config_path))
+
+        # One pooled HTTP/2 client shared by every scraper
+        self.client = BaseScraper.create_client()
 
         # Initialize scrapers
         self.scrapers = [
-            OpenMicUSScraper(str(config_path)),
-            EventbriteScraper(str(config_path)),
+            OpenMicUSScraper(shared_client=self.client, config=self.config),
+            EventbriteScraper(shared_client=self.client, config=self.config),
         ]
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Close the shared HTTP client."""
+        self.client.close()
+
     def search(
         self,
         cities: Optional[List[dict]] = None,
@@ -72,9 +88,8 @@ class OpenMicAggregator:
 
         print(f"\nSearching for open mics within {max_distance} miles of {home_city}...\n")
 
-        all_events = []
-
-        # Scrape each city with appropriate scrapers
+        # Collect each city with appropriate scrapers
+        jobs = []
         for city_info in cities:
             city = city_info.get("city", "")
             state = city_info.get("state", "")
@@ -88,133 +103,150 @@ class OpenMicAggregator:
                     if not city_info.get("openmic_us", False):
                         continue
 
-                try:
-                    events = scraper.scrape(city, state)
-                    all_events.extend(events)
-                except Exception as e:
-                    print(f"  Error with {scraper.SOURCE_NAME} for {city}: {e}")
+                jobs.append((scraper, city, state))
+
+        # Scrape all combinations concurrently
+        results = asyncio.run(self._scrape_all(jobs))
+
+        all_events = []
+        for (scraper, city, _), result in zip(jobs, results):
+            if isinstance(result, BaseException):
+                print(f"  Error with {scraper.SOURCE_NAME} for {city}: {result}")
+            else:
+                all_events.extend(result)
 
         # Deduplicate by venue name + day
         all_events = self._deduplicate(all_events)
 
         # Filter by distance
         if home_lat and home_lon:
-            all_events = filter_by_distance(all_events, home_lat, home_lon, max_distance)
+            all_events = self._filter_by_distance(all_events, home_lat, home_lon, max_distance)
 
         print(f"\nFound {len(all_events)} events total after filtering.\n")
 
         return all_events
 
-    def _deduplicate(self, events: List[OpenMicEvent]) -> List[OpenMicEvent]:
-        """Remove duplicate events based on venue name + day."""
-        seen = set()
-        unique = []
+    def _filter_by_distance(
+        self,
+        events: List[OpenMicEvent],
+        home_lat: float,
+        home_lon: float,
+        max_distance: float,
+    ) -> List[OpenMicEvent]:
+        """
+        Filter events by distance, geocoding unknown addresses online only
+        when the config enables "geocode_online".
+        """
+        if not self.config.get("geocode_online", False):
+            return filter_by_distance(events, home_lat, home_lon, max_distance)
 
-        for event in events:
-            # Create a key for deduplication
-            key = (
-                event.venue_name.lower().strip(),
-                event.day_of_week or "",
-                event.city.lower().strip(),
+        from .geo_cache import GeocodeCache, GeocodeCacheError
+
+        try:
+            geocoder = GeocodeCache()
+        except GeocodeCacheError as e:
+            print(f"  Geocoding unavailable: {e}")
+            return filter_by_distance(events, home_lat, home_lon, max_distance)
+
+        with geocoder:
+            return filter_by_distance(
+                events, home_lat, home_lon, max_distance, geocode=geocoder.lookup
             )
 
-            if key not in seen:
-                seen.add(key)
-                unique.append(event)
+    async def _scrape_all(self, jobs: List[tuple]) -> list:
+        """
+        Run (scraper, city, state) jobs concurrently.
+        Returns each job's events, or the exception it raised, in job order.
+        """
+        try:
+            return await asyncio.gather(
+                *(scraper.async_scrape(city, state) for scraper, city, state in jobs),
+                return_exceptions=True,
+            )
+        finally:
+            for scraper in self.scrapers:
+                await scraper.aclose()
+
+    def _deduplicate(self, events: List[OpenMicEvent]) -> List[OpenMicEvent]:
+        """Remove duplicate events based on venue name + day."""
+        seen = {}
+        for event in events:
+            seen.setdefault(event.dedup_key(), event)
 
-        return unique
+        return list(seen.values())
 
     def search_nearby(self, radius_miles: float = 100) -> List[OpenMicEvent]:
         """Search for events near the configured home location."""
         return self.search(max_distance=radius_miles)
 
 
+DAY_ORDER = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday", "Unknown")
+
+
 def display_events(events: List[OpenMicEvent], group_by: str = "day"):
     """Display events in a formatted way."""
     if not events:
         print("No events found.")
         return
 
+    # Collect all output lines and write them at once
+    lines = []
     if group_by == "day":
-        _display_by_day(events)
+        _display_by_day(events, lines)
     elif group_by == "distance":
-        _display_by_distance(events)
+        _display_by_distance(events, lines)
     else:
-        _display_flat(events)
+        _display_flat(events, lines)
 
+    sys.stdout.write("\n".join(lines) + "\n")
 
-def _display_by_day(events: List[OpenMicEvent]):
+
+def _display_by_day(events: List[OpenMicEvent], lines: List[str]):
     """Display events grouped by day of week."""
-    by_day = {}
+    by_day = defaultdict(list)
     for event in events:
-        day = event.day_of_week or "Unknown"
-        if day not in by_day:
-            by_day[day] = []
-        by_day[day].append(event)
-
-    day_order = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday", "Unknown"]
+        by_day[event.day_of_week or "Unknown"].append(event)
 
-    for day in day_order:
-        if day not in by_day:
+    for day in DAY_ORDER:
+        bucket = by_day.get(day)
+        if not bucket:
             continue
 
-        print(f"\n{'=' * 60}")
-        print(f"  {day.upper()}")
-        print(f"{'=' * 60}")
+        lines.append(f"\n{'=' * 60}")
+        lines.append(f"  {day.upper()}")
+        lines.append(f"{'=' * 60}")
 
-        # Sort by distance within day
-        day_events = sorted(
-            by_day[day],
-            key=lambda e: e.distance_miles if e.distance_miles is not None else float('inf')
-        )
+        # Events arrive sorted by distance (see filter_by_distance) and
+        # bucketing preserves that order, so no per-day re-sort is needed
+        for event in bucket:
+            _print_event(event, lines)
 
-        for event in day_events:
-            _print_event(event)
 
-
-def _display_by_distance(events: List[OpenMicEvent]):
+def _display_by_distance(events: List[OpenMicEvent], lines: List[str]):
     """Display events sorted by distance."""
-    print(f"\n{'=' * 60}")
-    print(f"  EVENTS BY DISTANCE")
-    print(f"{'=' * 60}")
+    lines.append(f"\n{'=' * 60}")
+    lines.append(f"  EVENTS BY DISTANCE")
+    lines.append(f"{'=' * 60}")
 
     for event in events:
-        _print_event(event)
+        _print_event(event, lines)
 
 
-def _display_flat(events: List[OpenMicEvent]):
+def _display_flat(events: List[OpenMicEvent], lines: List[str]):
     """Display events in a flat list."""
     for event in events:
-        _print_event(event)
-
-
-def _print_event(event: OpenMicEvent):
-    """Print a single event."""
-    print(f"\n  {event.venue_name}")
-    if event.event_name and event.event_name != event.venue_name:
-        print(f"    Event: {event.event_name}")
-    if event.day_of_week:
-        print(f"    Day: {event.day_of_week}")
-    if event.time:
-        print(f"    Time: {event.time}")
-    if event.address:
-        print(f"    Address: {event.address}")
-    if event.city and event.state:
-        print(f"    Location: {event.city}, {event.state}")
-    if event.phone:
-        print(f"    Phone: {event.phone}")
-    if event.distance_miles is not None:
-        print(f"    Distance: {event.distance_miles} mi")
-    if event.url:
-        print(f"    URL: {event.url}")
-    print(f"    Source: {event.source}")
+        _print_event(event, lines)
+
+
+def _print_event(event: OpenMicEvent, lines: List[str]):
+    """Add the output block for a single event, preceded by a blank line."""
+    lines.append(f"\n{event.format_block()}")
 
 
 def main():
     """Test the aggregator."""
-    aggregator = OpenMicAggregator()
-
-    events = aggregator.search_nearby(radius_miles=150)
+    with OpenMicAggregator() as aggregator:
+        events = aggregator.search_nearby(radius_miles=150)
     display_events(events, group_by="day")
 
 
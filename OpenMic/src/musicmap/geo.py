@@ -3,10 +3,27 @@
 Geographic utilities for distance filtering.
 """
 
+import functools
 import math
-from typing import Optional, Tuple
+import os
+from pathlib import Path
+from typing import Callable, Optional, Tuple, TYPE_CHECKING
 import re
 
+# numpy is imported where distances are computed, so importing this module
+# (e.g. for parse_location in `main --help`) stays cheap
+if TYPE_CHECKING:
+    import numpy as np
+
+
+# Per-user cache for compiled kernels and geocoding results
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "musicmap"
+
+# Below this many events, importing numba costs more than it saves
+NUMBA_MIN_EVENTS = 1000
+
+_LOCATION_RE = re.compile(r'^\s*([^,]+),\s*([A-Za-z]{2})\s*$')
+_CITY_STATE_RE = re.compile(r'([A-Za-z\s]+),\s*([A-Z]{2})\s*\d*')
 
 def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     """
@@ -27,6 +44,57 @@ def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> fl
     return R * c
 
 
+def haversine_distances(lat1: float, lon1: float, lats: "np.ndarray", lons: "np.ndarray") -> "np.ndarray":
+    """
+    Vectorized haversine_distance from one point to arrays of points.
+    Returns an array of distances in miles.
+    """
+    import numpy as np
+
+    R = 3959  # Earth's radius in miles
+
+    lat1_rad = math.radians(lat1)
+    lats_rad = np.radians(lats)
+    delta_lat = np.radians(lats - lat1)
+    delta_lon = np.radians(lons - lon1)
+
+    a = np.sin(delta_lat / 2) ** 2 + \
+        math.cos(lat1_rad) * np.cos(lats_rad) * np.sin(delta_lon / 2) ** 2
+    c = 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+
+    return R * c
+
+
+def _numpy_filter_kernel(
+    lats: "np.ndarray",
+    lons: "np.ndarray",
+    home_lat: float,
+    home_lon: float,
+    max_miles: float
+) -> Tuple["np.ndarray", "np.ndarray"]:
+    """NumPy equivalent of geo_numba.haversine_filter_kernel."""
+    distances = haversine_distances(home_lat, home_lon, lats, lons)
+    return distances, distances <= max_miles
+
+
+_numba_kernel = None
+
+
+def _get_filter_kernel(count: int):
+    """Pick the distance kernel: numba for large batches when installed, else NumPy."""
+    global _numba_kernel
+    if count < NUMBA_MIN_EVENTS:
+        return _numpy_filter_kernel
+
+    if _numba_kernel is None:
+        try:
+            from .geo_numba import haversine_filter_kernel
+            _numba_kernel = haversine_filter_kernel
+        except ImportError:
+            _numba_kernel = _numpy_filter_kernel
+    return _numba_kernel
+
+
 # Known city coordinates (expanded for SE US)
 CITY_COORDS = {
     # Georgia
@@ -58,6 +126,12 @@ CITY_COORDS = {
     ("dallas", "tx"): (32.7767, -96.7970),
 }
 
+# Casefolded view of CITY_COORDS, built once so lookups never re-normalize keys
+_CITY_COORDS_NORM = {
+    (city.casefold(), state.casefold()): coords
+    for (city, state), coords in CITY_COORDS.items()
+}
+
 
 def parse_location(location_str: str) -> Optional[Tuple[str, str, float, float]]:
     """
@@ -68,7 +142,7 @@ def parse_location(location_str: str) -> Optional[Tuple[str, str, float, float]]
         return None
 
     # Parse "City, ST" format
-    match = re.match(r'^\s*([^,]+),\s*([A-Za-z]{2})\s*$', location_str)
+    match = _LOCATION_RE.match(location_str)
     if not match:
         return None
 
@@ -84,10 +158,14 @@ def parse_location(location_str: str) -> Optional[Tuple[str, str, float, float]]
 
 def get_city_coords(city: str, state: str) -> Optional[Tuple[float, float]]:
     """Get coordinates for a known city."""
-    key = (city.lower().strip(), state.lower().strip())
-    return CITY_COORDS.get(key)
+    # Try the key as given first, so already-normalized lookups allocate nothing
+    coords = _CITY_COORDS_NORM.get((city, state))
+    if coords is not None:
+        return coords
+    return _CITY_COORDS_NORM.get((city.casefold().strip(), state.casefold().strip()))
 
 
+@functools.lru_cache(maxsize=2048)
 def estimate_coords_from_address(address: str) -> Optional[Tuple[float, float]]:
     """
     Try to extract city/state from address and return known coords.
@@ -97,7 +175,7 @@ def estimate_coords_from_address(address: str) -> Optional[Tuple[float, float]]:
         return None
 
     # Try to match "City, ST" or "City, ST ZIP" pattern
-    match = re.search(r'([A-Za-z\s]+),\s*([A-Z]{2})\s*\d*', address)
+    match = _CITY_STATE_RE.search(address)
     if match:
         city = match.group(1).strip()
         state = match.group(2).strip()
@@ -110,43 +188,65 @@ def filter_by_distance(
     events: list,
     home_lat: float,
     home_lon: float,
-    max_miles: float
+    max_miles: float,
+    geocode: Optional[Callable[[str], Optional[Tuple[float, float]]]] = None
 ) -> list:
     """
     Filter events by distance from home location.
     Updates distance_miles field on each event.
-    Returns events within max_miles, sorted by distance.
+    geocode, if given, resolves addresses that no known city matches
+    (e.g. geo_cache.GeocodeCache.lookup).
+    Returns events within max_miles, sorted by distance (stable), followed
+    by events with unknown distance. Display code relies on this order.
     """
-    filtered = []
+    import numpy as np
+
+    count = len(events)
+    lats = np.empty(count)
+    lons = np.empty(count)
+    has_coord = np.zeros(count, dtype=bool)
 
-    for event in events:
-        # Try to get coordinates
+    # Pass 1: resolve coordinates into parallel arrays
+    for i, event in enumerate(events):
         if event.lat and event.lon:
-            lat, lon = event.lat, event.lon
+            lats[i] = event.lat
+            lons[i] = event.lon
+            has_coord[i] = True
+            continue
+
+        # Try from city/state
+        coords = get_city_coords(event.city, event.state)
+        if not coords:
+            # Try from address
+            coords = estimate_coords_from_address(event.address)
+        if not coords and geocode is not None:
+            coords = geocode(event.address)
+        if coords:
+            event.lat, event.lon = coords
+            lats[i], lons[i] = coords
+            has_coord[i] = True
         else:
-            # Try from city/state
-            coords = get_city_coords(event.city, event.state)
-            if not coords:
-                # Try from address
-                coords = estimate_coords_from_address(event.address)
-            if coords:
-                lat, lon = coords
-                event.lat = lat
-                event.lon = lon
-            else:
-                # Can't determine location, include with unknown distance
-                event.distance_miles = None
-                filtered.append(event)
-                continue
-
-        # Calculate distance
-        distance = haversine_distance(home_lat, home_lon, lat, lon)
-        event.distance_miles = round(distance, 1)
-
-        if distance <= max_miles:
-            filtered.append(event)
-
-    # Sort by distance (None values at end)
-    filtered.sort(key=lambda e: e.distance_miles if e.distance_miles is not None else float('inf'))
-
-    return filtered
+            # Can't determine location, include with unknown distance
+            event.distance_miles = None
+
+    located = np.flatnonzero(has_coord)
+
+    # Unknown distances sort as +inf, so one stable argsort places them last
+    # in their original order; they are always kept
+    dist = np.full(count, np.inf)
+    keep = ~has_coord
+
+    if located.size:
+        # Pass 2: distances for every located event at once
+        kernel = _get_filter_kernel(located.size)
+        distances, within = kernel(lats[located], lons[located], home_lat, home_lon, max_miles)
+        rounded = np.round(distances, 1)
+        dist[located] = rounded
+        keep[located] = within
+
+        # Pass 3: write distances back through the index array
+        for i, distance in zip(located.tolist(), rounded.tolist()):
+            events[i].distance_miles = distance
+
+    keep = keep.tolist()
+    return [events[i] for i in np.argsort(dist, kind="stable").tolist() if keep[i]]
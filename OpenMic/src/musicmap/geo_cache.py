@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Persistent geocoding cache for addresses outside CITY_COORDS.
+Cache misses are geocoded once with Nominatim (geopy, optional).
+
+Online geocoding is opt-in: it is only used when the config sets
+"geocode_online": true, since every new address costs a rate-limited
+network request.
+"""
+
+import dbm
+import shelve
+from typing import Optional, Tuple
+
+from .geo import CACHE_DIR
+
+try:
+    from geopy.exc import GeopyError
+    from geopy.extra.rate_limiter import RateLimiter
+    from geopy.geocoders import Nominatim
+except ImportError:
+    Nominatim = None
+
+CACHE_PATH = CACHE_DIR / "geocache"
+
+
+class GeocodeCacheError(Exception):
+    """The geocoding cache could not be opened."""
+
+
+def _normalize(address: str) -> str:
+    """Cache key for an address: casefolded with whitespace collapsed."""
+    return " ".join(address.casefold().split())
+
+
+class GeocodeCache:
+    """
+    Disk-backed address -> (lat, lon) cache, kept open for one filter pass.
+
+    Use as a context manager; opening raises GeocodeCacheError if geopy is
+    not installed or the cache file cannot be opened.
+    """
+
+    def __init__(self):
+        if Nominatim is None:
+            raise GeocodeCacheError("geopy is not installed")
+
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            self._cache = shelve.open(str(CACHE_PATH))
+        except (OSError, dbm.error) as e:
+            raise GeocodeCacheError(str(e)) from e
+
+        # Rate limited per the Nominatim usage policy
+        geolocator = Nominatim(user_agent="musicmap")
+        self._geocode = RateLimiter(geolocator.geocode, min_delay_seconds=1, swallow_exceptions=False)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Close the cache file."""
+        self._cache.close()
+
+    def lookup(self, address: str) -> Optional[Tuple[float, float]]:
+        """
+        Get (lat, lon) for an address from the cache, geocoding it on a miss.
+        Returns None if the address cannot be resolved.
+        """
+        if not address:
+            return None
+
+        key = _normalize(address)
+        if key in self._cache:
+            return self._cache[key]
+
+        try:
+            location = self._geocode(address, timeout=5)
+        except GeopyError:
+            return None  # Transient failure, don't cache
+
+        # Also cache "not found" so it isn't requested again
+        coords = (location.latitude, location.longitude) if location else None
+        try:
+            self._cache[key] = coords
+        except (OSError, dbm.error):
+            pass  # Caching is best effort; the answer is still good
+        return coords
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Numba-compiled distance kernel for large event sets.
+Optional: geo.filter_by_distance falls back to NumPy when numba is not installed.
+"""
+
+import math
+import os
+
+from .geo import CACHE_DIR
+
+# Keep compiled kernels in the user cache dir so later runs skip compilation
+os.environ.setdefault("NUMBA_CACHE_DIR", str(CACHE_DIR / "numba"))
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True, fastmath=True)
+def haversine_filter_kernel(lats, lons, home_lat, home_lon, max_miles):
+    """
+    Distance in miles from home to each (lat, lon) point, fused with the
+    max_miles test. Returns (distances, within_mask).
+    """
+    R = 3959.0  # Earth's radius in miles
+
+    n = lats.shape[0]
+    distances = np.empty(n)
+    within = np.empty(n, dtype=np.bool_)
+    cos_home = math.cos(math.radians(home_lat))
+
+    for i in range(n):
+        delta_lat = math.radians(lats[i] - home_lat)
+        delta_lon = math.radians(lons[i] - home_lon)
+
+        a = math.sin(delta_lat / 2) ** 2 + \
+            cos_home * math.cos(math.radians(lats[i])) * math.sin(delta_lon / 2) ** 2
+        distance = R * 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+
+        distances[i] = distance
+        within[i] = distance <= max_miles
+
+    return distances, within
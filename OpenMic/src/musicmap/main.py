@@ -5,12 +5,34 @@ MusicMap CLI - Find open mic events near you.
 
 import argparse
 import json
+import sys
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .aggregator import OpenMicAggregator, display_events
 from .geo import parse_location
 
 
+def _write_json(output: list):
+    """Write output as indented JSON to stdout, via orjson when available."""
+    buffer = getattr(sys.stdout, "buffer", None)
+    if orjson and buffer is not None:
+        sys.stdout.flush()  # Keep earlier progress output ahead of the JSON
+        buffer.write(orjson.dumps(
+            output,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE,
+            default=str,
+        ))
+        buffer.flush()
+    else:
+        json.dump(output, sys.stdout, indent=2, default=str)
+        sys.stdout.write("\n")
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Find open mic events from multiple sources",
@@ -88,9 +110,6 @@ Examples:
         print("  Panama City FL, Dothan AL, Bainbridge GA, Albany GA, Atlanta GA")
         return
 
-    # Initialize aggregator
-    aggregator = OpenMicAggregator(config_path=args.config)
-
     # Build cities list if specified on command line
     cities = None
     if args.city:
@@ -101,12 +120,13 @@ Examples:
             cities.append({"city": city, "state": state})
 
     # Search with location override if provided
-    events = aggregator.search(cities=cities, max_distance=args.radius, location=location)
+    with OpenMicAggregator(config_path=args.config) as aggregator:
+        events = aggregator.search(cities=cities, max_distance=args.radius, location=location)
 
     # Output
     if args.json:
         output = [e.to_dict() for e in events]
-        print(json.dumps(output, indent=2, default=str))
+        _write_json(output)
     else:
         display_events(events, group_by=args.group)
 
@@ -3,12 +3,13 @@
 Unified event model for all open mic sources.
 """
 
+import sys
 from dataclasses import dataclass, field
 from typing import Optional
 from datetime import datetime, date
 
 
-@dataclass
+@dataclass(slots=True)
 class OpenMicEvent:
     """Unified open mic event from any source."""
     venue_name: str
@@ -33,6 +34,9 @@ class OpenMicEvent:
     event_date: Optional[date] = None
     event_name: Optional[str] = None
 
+    # Normalized key cached by dedup_key()
+    _dedup_key: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+
     def __str__(self) -> str:
         parts = [f"{self.venue_name}"]
         if self.event_name and self.event_name != self.venue_name:
@@ -45,6 +49,40 @@ class OpenMicEvent:
             parts.append(f"{self.distance_miles:.1f} mi")
         return " | ".join(parts)
 
+    def format_block(self) -> str:
+        """Multi-line listing used by the CLI display."""
+        lines = [f"  {self.venue_name}"]
+        if self.event_name and self.event_name != self.venue_name:
+            lines.append(f"    Event: {self.event_name}")
+        if self.day_of_week:
+            lines.append(f"    Day: {self.day_of_week}")
+        if self.time:
+            lines.append(f"    Time: {self.time}")
+        if self.address:
+            lines.append(f"    Address: {self.address}")
+        if self.city and self.state:
+            lines.append(f"    Location: {self.city}, {self.state}")
+        if self.phone:
+            lines.append(f"    Phone: {self.phone}")
+        if self.distance_miles is not None:
+            lines.append(f"    Distance: {self.distance_miles} mi")
+        if self.url:
+            lines.append(f"    URL: {self.url}")
+        lines.append(f"    Source: {self.source}")
+        return "\n".join(lines)
+
+    def dedup_key(self) -> tuple:
+        """Key identifying the same listing across sources (venue + day + city)."""
+        if self._dedup_key is None:
+            # Venues and cities repeat across days and sources; interning
+            # lets key comparisons short-circuit on identity
+            self._dedup_key = (
+                sys.intern(self.venue_name.lower().strip()),
+                sys.intern(self.day_of_week or ""),
+                sys.intern(self.city.lower().strip()),
+            )
+        return self._dedup_key
+
     def to_dict(self) -> dict:
         return {
             "venue_name": self.venue_name,
@@ -4,27 +4,114 @@ Base scraper class with shared utilities.
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional, List
-import requests
-from bs4 import BeautifulSoup
+from typing import Optional, List, Tuple, TYPE_CHECKING
+import asyncio
+import functools
+import httpx
 import re
 import json
 from pathlib import Path
 
+from lxml import etree, html
+
 from ..models.event import OpenMicEvent
 
+# bs4 is imported where it is used, so CLI paths that exit before scraping
+# (--help, unresolvable location) never pay for it
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+_PHONE_RE = re.compile(r'(\+?1?[\s\-]?\(?\d{3}\)?[\s\-]?\d{3}[\s\-]?\d{4})')
+_TIME_RE = re.compile(r'(\d{1,2}:\d{2}\s*[APap][Mm]|\d{1,2}\s*[APap][Mm])')
+_ADDR_RE = re.compile(
+    r'(\d+\s+[A-Za-z0-9\s\.]{3,30}(?:St|Dr|Rd|Ave|Blvd|Ln|Way|Ct|Pl)[\.]*,?\s+[A-Za-z\s]+,\s*[A-Z]{2}\s+\d{5})'
+)
+_WS_RE = re.compile(r'\s+')
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_load_config(path_str: str) -> dict:
+    """Load a JSON config file once per process. Callers must not mutate the result."""
+    path = Path(path_str)
+    if path.exists():
+        data = path.read_bytes()
+        return orjson.loads(data) if orjson else json.loads(data)
+    return {}
+
+
+# Text nodes as BeautifulSoup's get_text() sees them: no comments, scripts or styles
+_TEXT_XPATH = etree.XPath(".//text()[not(parent::script or parent::style)]")
+
+
+def _make_soup(content: bytes) -> "BeautifulSoup":
+    """Parse an HTML document with BeautifulSoup on top of lxml."""
+    from bs4 import BeautifulSoup
+    return BeautifulSoup(content, "lxml")
+
+
+def _make_tree(content: bytes, encoding: Optional[str]) -> Optional[html.HtmlElement]:
+    """Parse a response body into an lxml tree. Returns None for an empty body."""
+    # Hand libxml2 the raw bytes and the HTTP charset (httpx defaults to UTF-8)
+    # so decoding happens in C; parsers aren't thread-safe, so one per call
+    parser = html.HTMLParser(encoding=encoding or "utf-8")
+    try:
+        return html.document_fromstring(content, parser=parser)
+    except etree.ParserError:
+        return None
+
+
+def _element_text(element: html.HtmlElement, separator: str = "") -> str:
+    """lxml equivalent of BeautifulSoup's get_text(separator, strip=True)."""
+    return separator.join(s for s in (t.strip() for t in _TEXT_XPATH(element)) if s)
+
+
+class ResponseTooLarge(httpx.HTTPError):
+    """A response body exceeded BaseScraper.MAX_RESPONSE_BYTES."""
+
 
 class BaseScraper(ABC):
     """Abstract base class for all scrapers."""
 
     SOURCE_NAME = "base"
 
-    def __init__(self, config_path: Optional[str] = None):
-        self.session = requests.Session()
-        self.session.headers.update({
-            "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-        })
-        self.config = self._load_config(config_path)
+    HEADERS = {
+        "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+    }
+
+    # Max in-flight async requests per scraper, to avoid hammering hosts
+    MAX_CONCURRENT_REQUESTS = 10
+
+    # Connection pool for both clients. Idle connections are kept alive so the
+    # parallel day fetches pay for the TLS handshake once per host; over HTTP/2
+    # they multiplex onto that single connection anyway
+    POOL_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=50)
+
+    # Bodies are streamed and abandoned past this size; real listing pages
+    # are a few hundred KB at most
+    MAX_RESPONSE_BYTES = 10 * 1024 * 1024
+
+    def __init__(
+        self,
+        config_path: Optional[str] = None,
+        shared_client: Optional[httpx.Client] = None,
+        config: Optional[dict] = None,
+    ):
+        # Scrapers run by the aggregator share one HTTP/2 client, so fetches
+        # to the same host are multiplexed over a single pooled connection
+        self._owns_client = shared_client is None
+        self.client = shared_client if shared_client is not None else self.create_client()
+        # Callers that already parsed the config can hand it over directly
+        self.config = config if config is not None else self._load_config(config_path)
+
+        # Created lazily inside the running event loop (see _get_async_client)
+        self._async_client: Optional[httpx.AsyncClient] = None
+        self._async_limit: Optional[asyncio.Semaphore] = None
 
     def _load_config(self, config_path: Optional[str] = None) -> dict:
         """Load configuration from JSON file."""
@@ -34,42 +121,145 @@ class BaseScraper(ABC):
         else:
             config_path = Path(config_path)
 
-        if config_path.exists():
-            with open(config_path) as f:
-                return json.load(f)
-        return {}
+        return _cached_load_config(str(config_path))
+
+    @classmethod
+    def create_client(cls) -> httpx.Client:
+        """Build a pooled HTTP/2 client suitable for sharing between scrapers."""
+        return httpx.Client(
+            http2=True,
+            timeout=30,
+            headers=cls.HEADERS,
+            follow_redirects=True,
+            limits=cls.POOL_LIMITS,
+        )
+
+    def close(self):
+        """Close the sync client if this scraper created it."""
+        if self._owns_client:
+            self.client.close()
 
-    def fetch_page(self, url: str, **kwargs) -> Optional[BeautifulSoup]:
+    def _check_body_size(self, body: bytearray):
+        """Raise ResponseTooLarge once a streamed body passes the limit."""
+        if len(body) > self.MAX_RESPONSE_BYTES:
+            raise ResponseTooLarge(f"Response body exceeds {self.MAX_RESPONSE_BYTES} bytes")
+
+    def _get(self, url: str, **kwargs) -> Tuple[httpx.Response, bytes]:
+        """GET a URL, streaming the (decompressed) body under the size limit."""
+        with self.client.stream("GET", url, **kwargs) as response:
+            response.raise_for_status()
+            body = bytearray()
+            for chunk in response.iter_bytes():
+                body += chunk
+                self._check_body_size(body)
+        return response, bytes(body)
+
+    def fetch_page(self, url: str, **kwargs) -> Optional["BeautifulSoup"]:
         """Fetch and parse a page."""
         try:
-            response = self.session.get(url, timeout=30, **kwargs)
-            response.raise_for_status()
-            return BeautifulSoup(response.text, "html.parser")
-        except requests.RequestException as e:
+            _, content = self._get(url, **kwargs)
+            return _make_soup(content)
+        except httpx.HTTPError as e:
+            print(f"Error fetching {url}: {e}")
+            return None
+
+    def fetch_tree(self, url: str, **kwargs) -> Optional[html.HtmlElement]:
+        """Fetch a page as an lxml tree, for XPath-based parsing in hot loops."""
+        try:
+            response, content = self._get(url, **kwargs)
+            return _make_tree(content, response.encoding)
+        except httpx.HTTPError as e:
             print(f"Error fetching {url}: {e}")
             return None
 
     def fetch_json(self, url: str, **kwargs) -> Optional[dict]:
         """Fetch JSON data from URL."""
         try:
-            response = self.session.get(url, timeout=30, **kwargs)
-            response.raise_for_status()
-            return response.json()
-        except (requests.RequestException, json.JSONDecodeError) as e:
+            _, content = self._get(url, **kwargs)
+            return json.loads(content)
+        except (httpx.HTTPError, json.JSONDecodeError) as e:
+            print(f"Error fetching JSON from {url}: {e}")
+            return None
+
+    def _get_async_client(self) -> httpx.AsyncClient:
+        """Get the shared async HTTP/2 client, creating it on first use."""
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(
+                http2=True,
+                timeout=30,
+                headers=self.HEADERS,
+                cookies=httpx.Cookies(self.client.cookies),
+                follow_redirects=True,
+                limits=self.POOL_LIMITS,
+            )
+            self._async_limit = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+        return self._async_client
+
+    async def _get_async(self, url: str, **kwargs) -> Tuple[httpx.Response, bytes]:
+        """Async version of _get(), bounded by the concurrency semaphore."""
+        client = self._get_async_client()
+        async with self._async_limit:
+            async with client.stream("GET", url, **kwargs) as response:
+                response.raise_for_status()
+                body = bytearray()
+                async for chunk in response.aiter_bytes():
+                    body += chunk
+                    self._check_body_size(body)
+        return response, bytes(body)
+
+    async def fetch_page_async(self, url: str, **kwargs) -> Optional["BeautifulSoup"]:
+        """Fetch and parse a page without blocking the event loop."""
+        try:
+            _, content = await self._get_async(url, **kwargs)
+            return _make_soup(content)
+        except httpx.HTTPError as e:
+            print(f"Error fetching {url}: {e}")
+            return None
+
+    async def fetch_tree_async(self, url: str, **kwargs) -> Optional[html.HtmlElement]:
+        """Async version of fetch_tree()."""
+        try:
+            response, content = await self._get_async(url, **kwargs)
+            return _make_tree(content, response.encoding)
+        except httpx.HTTPError as e:
+            print(f"Error fetching {url}: {e}")
+            return None
+
+    async def fetch_json_async(self, url: str, **kwargs) -> Optional[dict]:
+        """Fetch JSON data from URL without blocking the event loop."""
+        try:
+            _, content = await self._get_async(url, **kwargs)
+            return json.loads(content)
+        except (httpx.HTTPError, json.JSONDecodeError) as e:
             print(f"Error fetching JSON from {url}: {e}")
             return None
 
+    async def aclose(self):
+        """Close the async client. A new one is created on next use."""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+            self._async_limit = None
+
     @abstractmethod
     def scrape(self, city: str, state: str) -> List[OpenMicEvent]:
         """Scrape events for a given city/state. Must be implemented by subclasses."""
         pass
 
+    async def async_scrape(self, city: str, state: str) -> List[OpenMicEvent]:
+        """
+        Async version of scrape().
+        Subclasses should override this with fetch_page_async; the default
+        runs the blocking scrape() in a worker thread.
+        """
+        return await asyncio.to_thread(self.scrape, city, state)
+
     # --- Shared parsing utilities ---
 
     @staticmethod
     def parse_phone(text: str) -> Optional[str]:
         """Extract phone number from text."""
-        match = re.search(r'(\+?1?[\s\-]?\(?\d{3}\)?[\s\-]?\d{3}[\s\-]?\d{4})', text)
+        match = _PHONE_RE.search(text)
         if match:
             return match.group(1).strip()
         return None
@@ -77,7 +267,7 @@ class BaseScraper(ABC):
     @staticmethod
     def parse_time(text: str) -> Optional[str]:
         """Extract time from text."""
-        match = re.search(r'(\d{1,2}:\d{2}\s*[APap][Mm]|\d{1,2}\s*[APap][Mm])', text)
+        match = _TIME_RE.search(text)
         if match:
             return match.group(1).strip()
         return None
@@ -85,10 +275,7 @@ class BaseScraper(ABC):
     @staticmethod
     def parse_address(text: str) -> Optional[str]:
         """Extract address from text."""
-        match = re.search(
-            r'(\d+\s+[A-Za-z0-9\s\.]{3,30}(?:St|Dr|Rd|Ave|Blvd|Ln|Way|Ct|Pl)[\.]*,?\s+[A-Za-z\s]+,\s*[A-Z]{2}\s+\d{5})',
-            text
-        )
+        match = _ADDR_RE.search(text)
         if match:
             return match.group(1).strip()
         return None
@@ -97,5 +284,5 @@ class BaseScraper(ABC):
     def clean_text(text: str) -> str:
         """Clean up extracted text."""
         # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
+        text = _WS_RE.sub(' ', text)
         return text.strip()
@@ -7,10 +7,47 @@ from typing import List, Optional
 from datetime import datetime
 import re
 import json
+import httpx
+from lxml import etree
 
-from .base import BaseScraper
+from .base import BaseScraper, _element_text
 from ..models.event import OpenMicEvent
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+# C ISO-8601 parser when installed; fromisoformat accepts a trailing "Z" on 3.11+
+try:
+    from ciso8601 import parse_datetime as _parse_iso_datetime
+except ImportError:
+    _parse_iso_datetime = datetime.fromisoformat
+
+_EVENT_CARD_RE = re.compile(r"event-card|search-event-card", re.I)
+_DAY_RE = re.compile(r'(Mon|Tue|Wed|Thu|Fri|Sat|Sun)', re.I)
+_DAY_MAP = {
+    "mon": "Monday", "tue": "Tuesday", "wed": "Wednesday",
+    "thu": "Thursday", "fri": "Friday", "sat": "Saturday", "sun": "Sunday"
+}
+
+
+def _xpath(path: str) -> etree.XPath:
+    """Compile an XPath with EXSLT regex support (re:test) enabled."""
+    return etree.XPath(path, namespaces={"re": "http://exslt.org/regular-expressions"})
+
+
+# Class matching mirrors the case-insensitive regex searches used before
+_TITLE_XPATH = _xpath(
+    "(.//*[self::h2 or self::h3 or self::a][re:test(@class, 'event-title|card-title', 'i')])[1]"
+)
+_HEADING_XPATH = _xpath("(.//h2|.//h3)[1]")
+_LINK_XPATH = _xpath("(.//a[@href])[1]")
+_VENUE_XPATH = _xpath("(.//*[re:test(@class, 'venue|location', 'i')])[1]")
+_DATE_XPATH = _xpath("(.//*[re:test(@class, 'date|time|when', 'i')])[1]")
+_ADDRESS_XPATH = _xpath("(.//*[re:test(@class, 'address|location-address', 'i')])[1]")
+_CONTEXT_XPATH = _xpath("ancestor::*[self::div or self::li or self::article][1]")
+
 
 class EventbriteScraper(BaseScraper):
     """Scraper for Eventbrite open mic events."""
@@ -18,21 +55,33 @@ class EventbriteScraper(BaseScraper):
     SOURCE_NAME = "eventbrite"
     BASE_URL = "https://www.eventbrite.com"
 
-    def __init__(self, config_path: Optional[str] = None):
-        super().__init__(config_path)
+    def __init__(
+        self,
+        config_path: Optional[str] = None,
+        shared_client: Optional[httpx.Client] = None,
+        config: Optional[dict] = None,
+    ):
+        super().__init__(config_path, shared_client, config)
 
         # Apply session token if available
         eb_config = self.config.get("eventbrite", {})
         if eb_config.get("session_token"):
-            self.session.cookies.set("SS", eb_config["session_token"])
+            # Scope to Eventbrite so the token never leaks to other hosts
+            # when the client is shared
+            self.client.cookies.set(
+                "SS", eb_config["session_token"], domain=".eventbrite.com"
+            )
 
     # Keywords that indicate an open mic event
-    OPEN_MIC_KEYWORDS = [
+    OPEN_MIC_KEYWORDS = (
         "open mic", "open-mic", "openmic",
         "poetry slam", "spoken word", "comedy night",
         "songwriter night", "acoustic night", "jam session",
         "karaoke", "talent show", "open stage"
-    ]
+    )
+
+    # All keywords as one alternation, so a name is scanned once
+    _KEYWORDS_RE = re.compile("|".join(map(re.escape, OPEN_MIC_KEYWORDS)), re.I)
 
     def search_url(self, city: str, state: str, query: str = "open-mic") -> str:
         """Build Eventbrite search URL."""
@@ -43,60 +92,92 @@ class EventbriteScraper(BaseScraper):
 
     def _is_open_mic_event(self, name: str) -> bool:
         """Check if event name suggests an open mic event."""
-        name_lower = name.lower()
-        return any(kw in name_lower for kw in self.OPEN_MIC_KEYWORDS)
+        return self._KEYWORDS_RE.search(name) is not None
 
     def scrape(self, city: str, state: str) -> List[OpenMicEvent]:
         """Scrape open mic events from Eventbrite for a city."""
         url = self.search_url(city, state)
         print(f"  Eventbrite: searching {city}, {state}...")
 
-        soup = self.fetch_page(url)
-        if not soup:
+        tree = self.fetch_tree(url)
+        if tree is None:
             return []
 
-        events = []
+        return self._parse_search_page(tree, city, state)
 
-        # Find event cards - Eventbrite uses various structures
-        # Look for event links with data or structured content
-        for card in soup.find_all("div", class_=re.compile(r"event-card|search-event-card", re.I)):
-            event = self._parse_event_card(card, city, state)
-            if event:
-                events.append(event)
+    async def async_scrape(self, city: str, state: str) -> List[OpenMicEvent]:
+        """Async version of scrape()."""
+        url = self.search_url(city, state)
+        print(f"  Eventbrite: searching {city}, {state}...")
 
-        # Also try finding events in script tags (JSON-LD)
-        for script in soup.find_all("script", type="application/ld+json"):
-            try:
-                data = json.loads(script.string)
-                if isinstance(data, list):
-                    for item in data:
-                        event = self._parse_jsonld_event(item, city, state)
-                        if event:
-                            events.append(event)
-                elif isinstance(data, dict):
-                    event = self._parse_jsonld_event(data, city, state)
+        tree = await self.fetch_tree_async(url)
+        if tree is None:
+            return []
+
+        return self._parse_search_page(tree, city, state)
+
+    def _parse_search_page(self, tree, city: str, state: str) -> List[OpenMicEvent]:
+        """Parse events from an Eventbrite search results page."""
+        card_events = []
+        jsonld_events = []
+        event_links = []
+
+        # One walk over the document, dispatching on tag: event cards, JSON-LD
+        # scripts, and /e/ links kept for the fallback parser
+        for el in tree.iter("div", "script", "a"):
+            tag = el.tag
+            if tag == "div":
+                if _EVENT_CARD_RE.search(el.get("class", "")):
+                    event = self._parse_event_card(el, city, state)
                     if event:
-                        events.append(event)
-            except (json.JSONDecodeError, TypeError):
-                continue
+                        card_events.append(event)
+            elif tag == "script":
+                if el.get("type") == "application/ld+json":
+                    jsonld_events.extend(self._parse_jsonld_script(el, city, state))
+            elif "/e/" in el.get("href", "").lower():
+                event_links.append(el)
+
+        # Cards stay ahead of JSON-LD events, as with the old separate passes
+        events = card_events + jsonld_events
 
         # Try parsing from the main content area
         if not events:
-            events = self._parse_search_results(soup, city, state)
+            events = self._parse_search_results(event_links, city, state)
+
+        return events
+
+    def _parse_jsonld_script(self, script, city: str, state: str) -> List[OpenMicEvent]:
+        """Parse the events in one JSON-LD script element."""
+        events = []
+        try:
+            data = _json_loads(script.text)
+
+            # Flatten single objects and @graph containers into one item list
+            if isinstance(data, dict):
+                data = data.get("@graph", [data])
+            if not isinstance(data, list):
+                return events
+
+            for item in data:
+                # Skip non-events before doing any per-item work
+                if not isinstance(item, dict) or item.get("@type") != "Event":
+                    continue
+                event = self._parse_jsonld_event(item, city, state)
+                if event:
+                    events.append(event)
+        except (json.JSONDecodeError, TypeError):
+            pass
 
         return events
 
     def _parse_event_card(self, card, city: str, state: str) -> Optional[OpenMicEvent]:
         """Parse an event card element."""
         # Try to find event name
-        name_elem = card.find(["h2", "h3", "a"], class_=re.compile(r"event-title|card-title", re.I))
-        if not name_elem:
-            name_elem = card.find(["h2", "h3"])
-
+        name_elem = _TITLE_XPATH(card) or _HEADING_XPATH(card)
         if not name_elem:
             return None
 
-        event_name = name_elem.get_text(strip=True)
+        event_name = _element_text(name_elem[0])
         if not event_name or len(event_name) < 3:
             return None
 
@@ -106,9 +187,9 @@ class EventbriteScraper(BaseScraper):
 
         # Get event URL
         url = None
-        link = card.find("a", href=True)
+        link = _LINK_XPATH(card)
         if link:
-            href = link.get("href", "")
+            href = link[0].get("href", "")
             if href.startswith("/"):
                 url = f"{self.BASE_URL}{href}"
             elif href.startswith("http"):
@@ -116,32 +197,27 @@ class EventbriteScraper(BaseScraper):
 
         # Try to find venue
         venue_name = event_name  # Default to event name
-        venue_elem = card.find(class_=re.compile(r"venue|location", re.I))
+        venue_elem = _VENUE_XPATH(card)
         if venue_elem:
-            venue_name = venue_elem.get_text(strip=True)
+            venue_name = _element_text(venue_elem[0])
 
         # Try to find date/time
-        date_elem = card.find(class_=re.compile(r"date|time|when", re.I))
+        date_elem = _DATE_XPATH(card)
         time_str = None
         day_of_week = None
         if date_elem:
-            date_text = date_elem.get_text(strip=True)
+            date_text = _element_text(date_elem[0])
             time_str = self.parse_time(date_text)
             # Try to extract day
-            day_match = re.search(r'(Mon|Tue|Wed|Thu|Fri|Sat|Sun)', date_text, re.I)
+            day_match = _DAY_RE.search(date_text)
             if day_match:
-                day_abbrev = day_match.group(1).lower()
-                day_map = {
-                    "mon": "Monday", "tue": "Tuesday", "wed": "Wednesday",
-                    "thu": "Thursday", "fri": "Friday", "sat": "Saturday", "sun": "Sunday"
-                }
-                day_of_week = day_map.get(day_abbrev)
+                day_of_week = _DAY_MAP.get(day_match.group(1).lower())
 
         # Try to find address
         address = None
-        addr_elem = card.find(class_=re.compile(r"address|location-address", re.I))
+        addr_elem = _ADDRESS_XPATH(card)
         if addr_elem:
-            address = addr_elem.get_text(strip=True)
+            address = _element_text(addr_elem[0])
 
         return OpenMicEvent(
             venue_name=venue_name,
@@ -175,13 +251,12 @@ class EventbriteScraper(BaseScraper):
 
         address = None
         if isinstance(address_data, dict):
-            parts = [
-                address_data.get("streetAddress", ""),
-                address_data.get("addressLocality", ""),
-                address_data.get("addressRegion", ""),
-                address_data.get("postalCode", ""),
-            ]
-            address = ", ".join(p for p in parts if p)
+            address = ", ".join(filter(None, (
+                address_data.get("streetAddress"),
+                address_data.get("addressLocality"),
+                address_data.get("addressRegion"),
+                address_data.get("postalCode"),
+            )))
         elif isinstance(address_data, str):
             address = address_data
 
@@ -198,7 +273,7 @@ class EventbriteScraper(BaseScraper):
 
         if start_date:
             try:
-                dt = datetime.fromisoformat(start_date.replace("Z", "+00:00"))
+                dt = _parse_iso_datetime(start_date)
                 time_str = dt.strftime("%I:%M %p").lstrip("0")
                 day_of_week = dt.strftime("%A")
                 event_date = dt.date()
@@ -220,13 +295,12 @@ class EventbriteScraper(BaseScraper):
             lon=lon,
         )
 
-    def _parse_search_results(self, soup, city: str, state: str) -> List[OpenMicEvent]:
-        """Fallback parser for search results page."""
+    def _parse_search_results(self, links, city: str, state: str) -> List[OpenMicEvent]:
+        """Fallback parser for search results page, given its /e/ event links."""
         events = []
 
-        # Look for any links that look like events
-        for link in soup.find_all("a", href=re.compile(r"/e/", re.I)):
-            event_name = link.get_text(strip=True)
+        for link in links:
+            event_name = _element_text(link)
             if not event_name or len(event_name) < 5:
                 continue
 
@@ -238,10 +312,10 @@ class EventbriteScraper(BaseScraper):
             url = href if href.startswith("http") else f"{self.BASE_URL}{href}"
 
             # Try to get surrounding context for time/venue
-            parent = link.find_parent(["div", "li", "article"])
+            parent = _CONTEXT_XPATH(link)
             time_str = None
             if parent:
-                text = parent.get_text(" ", strip=True)
+                text = _element_text(parent[0], " ")
                 time_str = self.parse_time(text)
 
             events.append(OpenMicEvent(
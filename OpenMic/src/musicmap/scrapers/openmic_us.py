@@ -3,12 +3,37 @@
 Scraper for openmic.us - a directory of open mic events across the US.
 """
 
-from typing import Optional, List
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Tuple
+import asyncio
 import re
+import sys
 
-from .base import BaseScraper
+from lxml import etree
+
+from .base import BaseScraper, _ADDR_RE, _PHONE_RE, _TIME_RE, _element_text
 from ..models.event import OpenMicEvent
 
+_NON_DIGIT_RE = re.compile(r'\D')
+
+# Phone and address as one alternation, so listing text is scanned once for both
+_FIELDS_RE = re.compile(f"(?P<phone>{_PHONE_RE.pattern})|(?P<address>{_ADDR_RE.pattern})")
+
+# Navigation/junk items to skip
+_SKIP_NAMES = frozenset({
+    "home", "austin", "open mic austin", "beatbuddy", "albuquerque",
+    "alaska", "auckland, new zealand", "related links:", "traveling?",
+    "open mics by u.s. cities:", "open mics by u.s. states:",
+    "open mics by international cities:", "paid gigs for party bands",
+    "corporate event bands, solo musicians, and djs"
+})
+
+# Listing containers, and the first bold/link inside one that names the venue
+_CONTAINER_XPATH = etree.XPath("//div|//tr|//td")
+_BOLD_XPATH = etree.XPath("(.//strong|.//b)[1]")
+_LINK_XPATH = etree.XPath("(.//a)[1]")
+
 
 class OpenMicUSScraper(BaseScraper):
     """Scraper for openmic.us network of sites."""
@@ -16,13 +41,24 @@ class OpenMicUSScraper(BaseScraper):
     SOURCE_NAME = "openmic.us"
     BASE_URL = "https://www.openmic.us"
 
+    # Day mapping for AJAX endpoints
+    DAYS = [
+        (1, "mondiv", "Monday"),
+        (2, "tuediv", "Tuesday"),
+        (3, "weddiv", "Wednesday"),
+        (4, "thudiv", "Thursday"),
+        (5, "fridiv", "Friday"),
+        (6, "satdiv", "Saturday"),
+        (7, "sundiv", "Sunday"),
+    ]
+
     @staticmethod
     def extract_area_code(phone: str) -> str:
         """Extract 3-digit area code from phone number."""
         if not phone:
             return ""
         # Remove non-digits
-        digits = re.sub(r'\D', '', phone)
+        digits = _NON_DIGIT_RE.sub('', phone)
         # Handle +1 prefix
         if len(digits) == 11 and digits.startswith('1'):
             digits = digits[1:]
@@ -48,11 +84,17 @@ class OpenMicUSScraper(BaseScraper):
         sites = self.config.get("openmic_us_sites", {})
         return sites.get(city_lower, {})
 
+    # City links from the main page, fetched once per scraper (see get_main_page_links)
+    _main_links: Optional[dict] = None
+
     def get_main_page_links(self) -> dict:
         """Get all city/state links from the main page."""
+        if self._main_links is not None:
+            return self._main_links
+
         soup = self.fetch_page(self.BASE_URL)
         if not soup:
-            return {}
+            return {}  # Not cached, so a later call can retry
 
         links = {}
         for a in soup.find_all("a", href=True):
@@ -61,129 +103,180 @@ class OpenMicUSScraper(BaseScraper):
             if text and ("openmic" in href.lower() or "open-mic" in href.lower()):
                 links[text] = href
 
+        self._main_links = links
         return links
 
     def scrape(self, city: str, state: str = "") -> List[OpenMicEvent]:
         """Scrape events for a specific city (implements BaseScraper interface)."""
         return self.scrape_city(city)
 
-    def scrape_city(self, city: str) -> List[OpenMicEvent]:
-        """Scrape events for a specific city using AJAX endpoints."""
-        site_config = self.get_site_config(city)
+    async def async_scrape(self, city: str, state: str = "") -> List[OpenMicEvent]:
+        """Scrape events for a city, fetching all day listings concurrently."""
+        base_url, site_state = self._resolve_site(city)
+        if not base_url:
+            print(f"  OpenMic.US: no site configured for {city}")
+            return []
 
-        if site_config:
-            base_url = site_config.get("url")
-            state = site_config.get("state", "")
-        else:
-            # Fallback for unknown cities
-            city_lower = city.lower().replace(" ", "")
-            base_url = f"https://www.openmic{city_lower}.com"
-            state = ""
+        print(f"  OpenMic.US: scraping {city.title()}...")
+
+        day_urls = self._day_urls(base_url)
+        trees = await asyncio.gather(*(self.fetch_tree_async(url) for url, _ in day_urls))
+
+        all_events = []
+        for (_, day_name), tree in zip(day_urls, trees):
+            if tree is None:
+                continue
+
+            events = self._parse_ajax_listings(tree, city.title(), site_state, day_name)
+            all_events.extend(events)
+
+        return self._filter_area_codes(all_events)
 
+    def scrape_city(self, city: str) -> List[OpenMicEvent]:
+        """Scrape events for a specific city using AJAX endpoints."""
+        base_url, state = self._resolve_site(city)
         if not base_url:
             print(f"  OpenMic.US: no site configured for {city}")
             return []
 
-        # Day mapping for AJAX endpoints
-        days = [
-            (1, "mondiv", "Monday"),
-            (2, "tuediv", "Tuesday"),
-            (3, "weddiv", "Wednesday"),
-            (4, "thudiv", "Thursday"),
-            (5, "fridiv", "Friday"),
-            (6, "satdiv", "Saturday"),
-            (7, "sundiv", "Sunday"),
-        ]
-
         all_events = []
         print(f"  OpenMic.US: scraping {city.title()}...")
 
-        for day_num, day_div, day_name in days:
-            url = f"{base_url}/events/frontlisting/{day_num}/{day_div}/1-2-3"
-            soup = self.fetch_page(url)
-            if not soup:
+        # Day listings are independent, so fetch them all at once; the shared
+        # httpx client is thread-safe and map() keeps results in day order
+        day_urls = self._day_urls(base_url)
+        with ThreadPoolExecutor(max_workers=len(day_urls)) as executor:
+            trees = list(executor.map(self.fetch_tree, (url for url, _ in day_urls)))
+
+        for (_, day_name), tree in zip(day_urls, trees):
+            if tree is None:
                 continue
 
-            events = self._parse_ajax_listings(soup, city.title(), state, day_name)
+            events = self._parse_ajax_listings(tree, city.title(), state, day_name)
             all_events.extend(events)
 
-        # Filter by area code if configured
+        return self._filter_area_codes(all_events)
+
+    def _resolve_site(self, city: str) -> Tuple[Optional[str], str]:
+        """Get (base_url, state) for a city, guessing the URL for unknown cities."""
+        site_config = self.get_site_config(city)
+
+        if site_config:
+            return site_config.get("url"), site_config.get("state", "")
+
+        # Fallback for unknown cities
+        city_lower = city.lower().replace(" ", "")
+        return f"https://www.openmic{city_lower}.com", ""
+
+    def _day_urls(self, base_url: str) -> List[Tuple[str, str]]:
+        """Build (url, day_name) pairs for each day's AJAX listing endpoint."""
+        return [
+            (f"{base_url}/events/frontlisting/{day_num}/{day_div}/1-2-3", day_name)
+            for day_num, day_div, day_name in self.DAYS
+        ]
+
+    def _filter_area_codes(self, all_events: List[OpenMicEvent]) -> List[OpenMicEvent]:
+        """Filter by area code if configured."""
         filter_mode = self.config.get("filter_mode", "none")
         if filter_mode == "area_code":
+            local_codes = frozenset(self.config.get("local_area_codes", ()))
+            if not local_codes:
+                return all_events  # No codes configured, allow all
+
             before_count = len(all_events)
-            all_events = [e for e in all_events if self.is_local_area_code(e.phone)]
+            extract = self.extract_area_code
+            all_events = [e for e in all_events if extract(e.phone) in local_codes]
             filtered = before_count - len(all_events)
             if filtered > 0:
                 print(f"    (filtered {filtered} non-local area codes)")
 
         return all_events
 
-    def _parse_ajax_listings(self, soup, city: str, state: str, day: str) -> List[OpenMicEvent]:
+    @staticmethod
+    def _scan_fields(text: str) -> dict:
+        """
+        Find the first phone number and address in text with a single scan.
+        Matches are consumed left to right, so a phone number can no longer
+        borrow the trailing digit of a preceding ZIP code.
+        """
+        fields = {}
+        for match in _FIELDS_RE.finditer(text):
+            kind = match.lastgroup
+            if kind not in fields:
+                fields[kind] = match.group(kind).strip()
+                if len(fields) == 2:
+                    break
+        return fields
+
+    def _parse_ajax_listings(self, tree, city: str, state: str, day: str) -> List[OpenMicEvent]:
         """Parse venue listings from AJAX response HTML."""
         events = []
 
-        # Navigation/junk items to skip
-        skip_names = {
-            "home", "austin", "open mic austin", "beatbuddy", "albuquerque",
-            "alaska", "auckland, new zealand", "related links:", "traveling?",
-            "open mics by u.s. cities:", "open mics by u.s. states:",
-            "open mics by international cities:", "paid gigs for party bands",
-            "corporate event bands, solo musicians, and djs"
-        }
+        # Skip navigation items and names that look like a configured city
+        skip_names = _SKIP_NAMES | self.config.get("openmic_us_sites", {}).keys()
+
+        # Lowercased names already listed; nested containers repeat the same venue
+        seen_venues = set()
+
+        # Hoist lookups out of the per-container loop
+        time_search = _TIME_RE.search
+        scan_fields = self._scan_fields
+        source = self.SOURCE_NAME
 
         # Find listing items - look for elements with time/phone patterns
-        for container in soup.find_all(["div", "tr", "td"]):
-            text = container.get_text(separator=" ", strip=True)
+        for container in _CONTAINER_XPATH(tree):
+            text = _element_text(container, " ")
+
+            # Every time match ends in an am/pm token (any case), so substring
+            # checks can reject most navigation/chrome text without the regex
+            if not ("pm" in text or "PM" in text or "am" in text or "AM" in text
+                    or "Pm" in text or "Am" in text or "pM" in text or "aM" in text):
+                continue
 
             # Must have a time pattern to be a valid venue listing
-            time_match = re.search(r'(\d{1,2}:\d{2}\s*[APap][Mm]|\d{1,2}\s*[APap][Mm])', text)
+            time_match = time_search(text)
             if not time_match:
                 continue
 
             # Look for venue name (bold/strong text or link)
             venue_name = None
-            name_elem = container.find(["strong", "b"])
+            name_elem = _BOLD_XPATH(container)
             if name_elem:
-                venue_name = name_elem.get_text(strip=True)
+                venue_name = _element_text(name_elem[0])
 
             # Also check for links that might be venue names
             if not venue_name:
-                link = container.find("a")
+                link = _LINK_XPATH(container)
                 if link:
-                    venue_name = link.get_text(strip=True)
+                    venue_name = _element_text(link[0])
 
             if not venue_name or len(venue_name) < 3:
                 continue
 
-            # Skip navigation items
-            if venue_name.lower() in skip_names:
+            key = venue_name.lower()
+            if key in skip_names:
                 continue
 
-            # Skip if name looks like a configured city
-            configured_sites = self.config.get("openmic_us_sites", {})
-            if venue_name.lower() in configured_sites:
+            # Avoid duplicates
+            if key in seen_venues:
                 continue
+            seen_venues.add(key)
 
-            # Extract address
-            address = self.parse_address(text)
-
-            # Extract phone
-            phone = self.parse_phone(text)
-
+            fields = scan_fields(text)
+            address = fields.get("address")
+            phone = fields.get("phone")
             time_str = time_match.group(1)
 
-            # Avoid duplicates
-            if not any(e.venue_name == venue_name for e in events):
-                events.append(OpenMicEvent(
-                    venue_name=venue_name,
-                    city=city,
-                    state=state,
-                    source=self.SOURCE_NAME,
-                    address=address,
-                    day_of_week=day,
-                    time=time_str,
-                    phone=phone
-                ))
+            events.append(OpenMicEvent(
+                venue_name=venue_name,
+                city=city,
+                state=state,
+                source=source,
+                address=address,
+                day_of_week=day,
+                time=time_str,
+                phone=phone
+            ))
 
         return events
 
@@ -195,36 +288,37 @@ def display_events(events: List[OpenMicEvent]):
         return
 
     # Group by day
-    by_day = {}
+    by_day = defaultdict(list)
     for event in events:
-        day = event.day_of_week or "Unknown"
-        if day not in by_day:
-            by_day[day] = []
-        by_day[day].append(event)
+        by_day[event.day_of_week or "Unknown"].append(event)
 
     # Display in day order
-    day_order = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday", "Unknown"]
+    day_order = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday", "Unknown")
 
-    print(f"\nFound {len(events)} open mic events:\n")
+    # Collect all output lines and write them at once
+    lines = [f"\nFound {len(events)} open mic events:\n"]
 
     for day in day_order:
-        if day not in by_day:
+        bucket = by_day.get(day)
+        if not bucket:
             continue
-        print(f"{'=' * 50}")
-        print(f"  {day.upper()}")
-        print(f"{'=' * 50}")
+        lines.append(f"{'=' * 50}")
+        lines.append(f"  {day.upper()}")
+        lines.append(f"{'=' * 50}")
 
-        for event in by_day[day]:
-            print(f"\n  {event.venue_name}")
+        for event in bucket:
+            lines.append(f"\n  {event.venue_name}")
             if event.time:
-                print(f"    Time: {event.time}")
+                lines.append(f"    Time: {event.time}")
             if event.address:
-                print(f"    Address: {event.address}")
+                lines.append(f"    Address: {event.address}")
             if event.phone:
-                print(f"    Phone: {event.phone}")
+                lines.append(f"    Phone: {event.phone}")
             if event.distance_miles is not None:
-                print(f"    Distance: {event.distance_miles} mi")
-        print()
+                lines.append(f"    Distance: {event.distance_miles} mi")
+        lines.append("")
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main(city: str = "panhandle"):
@@ -238,6 +332,5 @@ def main(city: str = "panhandle"):
 
 
 if __name__ == "__main__":
-    import sys
     city = sys.argv[1] if len(sys.argv) > 1 else "panhandle"
     main(city)
@@ -4,188 +4,269 @@ Analyze ToneX Preset Parameters
 Parses the schema and data dump to show which parameters are editable and their meanings
 """
 
+import csv
+import functools
 import re
-from typing import List, Dict, Tuple
+import string
+import sys
+from typing import List, Dict, Optional, Tuple
+
+import numpy as np
+
+_COL_RE = re.compile(r'\[([^\]]+)\]')
+
+# Data dump rows: tab-separated, no quoting
+_TSV_FORMAT = {'delimiter': '\t', 'quoting': csv.QUOTE_NONE}
+
+_METADATA = frozenset({
+    'GUID', 'Version', 'ToneModel_GUID', 'OptionalToneModel_GUID', 'Tag_PresetName',
+    'Tag_UserName', 'Tag_ModelerTags', 'Tag_Date', 'Tag_ModelCategory', 'Tag_Instrument',
+    'Tag_InstrumentType', 'Tag_PickupPosition', 'Tag_PickupType', 'Tag_Artist',
+    'Tag_Album', 'Tag_Song', 'Tag_SongPart', 'Tag_Genre', 'Tag_Description',
+})
+
+# Column name prefix -> category. Prefixes are tried shortest first, so
+# 'Mod' claims the Model* columns before 'Model' is reached
+_PREFIX_MAP = {
+    'HWParamA_': 'Hardware Control A',
+    'HWParamB_': 'Hardware Control B',
+    'Eq': 'EQ',
+    'PwrAmpEq': 'EQ',
+    'Comp': 'Compression',
+    'NoiseGate': 'Noise Gate',
+    'Mod': 'Modulation',
+    'Delay': 'Delay',
+    'Reverb': 'Reverb',
+    'Cab': 'Cabinet',
+    'VIRCab': 'Cabinet',
+    'Model': 'Amp Model',
+}
+_PREFIX_LENGTHS = tuple(sorted({len(prefix) for prefix in _PREFIX_MAP}))
+
+# Category names in report order; a category's id is its index here
+_CATEGORY_NAMES = (
+    'Metadata', 'Amp Model', 'EQ', 'Compression', 'Noise Gate', 'Modulation',
+    'Delay', 'Reverb', 'Cabinet', 'Hardware Control A', 'Hardware Control B', 'Other',
+)
+_CATEGORY_IDS = {name: i for i, name in enumerate(_CATEGORY_NAMES)}
+
+# Unique identifiers that always differ between presets
+_COMPARE_SKIP = frozenset({'GUID', 'ToneModel_GUID', 'OptionalToneModel_GUID', 'Tag_PresetName'})
+_HW_CATEGORIES = frozenset({'Hardware Control A', 'Hardware Control B'})
+# Categories whose columns main() lists by name (hardware ones are only counted)
+_LISTED_CATEGORIES = tuple(name for name in _CATEGORY_NAMES if name not in _HW_CATEGORIES)
 
 
 def parse_schema(schema_line: str) -> List[str]:
     """Parse the schema definition to extract column names"""
-    # Extract all column definitions between [ and ]
-    columns = re.findall(r'\[([^\]]+)\]', schema_line)
-    return columns
+    # Extract all column definitions between [ and ]. Well-formed schemas
+    # split on '[' directly; anything unusual (unclosed or empty brackets)
+    # goes through the regex instead
+    pieces = schema_line.split('[')[1:]
+    columns = [piece.partition(']')[0] for piece in pieces]
+    if not (all(columns) and all(']' in piece for piece in pieces)):
+        columns = _COL_RE.findall(schema_line)
+
+    # Interned so set and dict lookups against the (compiler-interned) name
+    # constants in _METADATA and _COMPARE_SKIP can match on identity
+    return [sys.intern(col) for col in columns]
 
 
 def parse_data_row(data_line: str) -> List[str]:
     """Parse a data row (tab-separated values)"""
-    return data_line.strip().split('\t')
+    line = data_line.strip()
+    try:
+        rows = list(csv.reader((line,), **_TSV_FORMAT))
+    except csv.Error:
+        rows = None  # e.g. an embedded line break
+    if rows is None or len(rows) > 1:
+        return line.split('\t')
+    # An empty line still yields one empty field, as str.split would
+    return rows[0] if rows and rows[0] else ['']
+
+
+@functools.lru_cache(maxsize=4096)
+def _classify_column(col: str) -> str:
+    """Return the category name for a single column (memoized per name)"""
+    if col in _METADATA:
+        return 'Metadata'
+    for length in _PREFIX_LENGTHS:
+        category = _PREFIX_MAP.get(col[:length])
+        if category:
+            return category
+    if col == 'BPM':
+        return 'Amp Model'
+    return 'Other'
+
+
+def _build_column_categories(columns: List[str]) -> List[str]:
+    """Return the category of each column, parallel to columns"""
+    return [_classify_column(col) for col in columns]
 
 
 def categorize_parameters(columns: List[str]) -> Dict[str, List[str]]:
     """Categorize parameters by their function"""
-    categories = {
-        'Metadata': [],
-        'Amp Model': [],
-        'EQ': [],
-        'Compression': [],
-        'Noise Gate': [],
-        'Modulation': [],
-        'Delay': [],
-        'Reverb': [],
-        'Cabinet': [],
-        'Hardware Control A': [],
-        'Hardware Control B': [],
-        'Other': []
-    }
-
-    for col in columns:
-        if col.startswith('HWParamA_'):
-            categories['Hardware Control A'].append(col)
-        elif col.startswith('HWParamB_'):
-            categories['Hardware Control B'].append(col)
-        elif col in ['GUID', 'Version', 'ToneModel_GUID', 'OptionalToneModel_GUID', 'Tag_PresetName',
-                     'Tag_UserName', 'Tag_ModelerTags', 'Tag_Date', 'Tag_ModelCategory', 'Tag_Instrument',
-                     'Tag_InstrumentType', 'Tag_PickupPosition', 'Tag_PickupType', 'Tag_Artist',
-                     'Tag_Album', 'Tag_Song', 'Tag_SongPart', 'Tag_Genre', 'Tag_Description']:
-            categories['Metadata'].append(col)
-        elif col.startswith('Eq') or col.startswith('PwrAmpEq'):
-            categories['EQ'].append(col)
-        elif col.startswith('Comp'):
-            categories['Compression'].append(col)
-        elif col.startswith('NoiseGate'):
-            categories['Noise Gate'].append(col)
-        elif col.startswith('Mod'):
-            categories['Modulation'].append(col)
-        elif col.startswith('Delay'):
-            categories['Delay'].append(col)
-        elif col.startswith('Reverb'):
-            categories['Reverb'].append(col)
-        elif col.startswith('Cab') or col.startswith('VIRCab'):
-            categories['Cabinet'].append(col)
-        elif col.startswith('Model') or col in ['BPM']:
-            categories['Amp Model'].append(col)
-        elif col in ['HW_ExtControllerEnable', 'Favorite']:
-            categories['Other'].append(col)
-        else:
-            categories['Other'].append(col)
-
-    return categories
+    # One byte per column holding its category id, then one mask per category
+    cat_ids = np.frombuffer(
+        bytearray(_CATEGORY_IDS[_classify_column(col)] for col in columns), dtype=np.uint8)
+    cols = np.array(columns, dtype=object)
+
+    return {name: cols[cat_ids == i].tolist() for i, name in enumerate(_CATEGORY_NAMES)}
+
+
+def _preset_matrix(rows: List[List[str]], width: int) -> np.ndarray:
+    """Stack preset rows into an object array of shape (len(rows), width); None pads short rows"""
+    matrix = np.full((len(rows), width), None, dtype=object)
+    for i, row in enumerate(rows):
+        row = row[:width]
+        matrix[i, :len(row)] = row
+    return matrix
+
+
+def _as_row(data, width: int) -> np.ndarray:
+    """View one preset as an object array of exactly width values"""
+    row = np.asarray(data, dtype=object)
+    if row.shape != (width,):
+        row = _preset_matrix([list(data)], width)[0]
+    return row
 
 
 def compare_presets(columns: List[str], preset1_data: List[str], preset2_data: List[str],
-                   preset1_name: str, preset2_name: str) -> Dict[str, List[Tuple[str, str, str]]]:
+                   preset1_name: str, preset2_name: str,
+                   col_categories: Optional[List[str]] = None) -> Dict[str, List[Tuple[str, str, str]]]:
     """Compare two presets and show differences"""
+    if col_categories is None:
+        col_categories = _build_column_categories(columns)
+
+    # Compare every column at once; None (padding past a short row) never counts
+    val1 = _as_row(preset1_data, len(columns))
+    val2 = _as_row(preset2_data, len(columns))
+    changed = (val1 != val2) & np.not_equal(val1, None) & np.not_equal(val2, None)
+
     differences = {}
 
-    for i, col in enumerate(columns):
-        if i < len(preset1_data) and i < len(preset2_data):
-            val1 = preset1_data[i]
-            val2 = preset2_data[i]
-
-            if val1 != val2:
-                # Skip GUID and similar unique identifiers
-                if col not in ['GUID', 'ToneModel_GUID', 'OptionalToneModel_GUID', 'Tag_PresetName']:
-                    category = None
-                    if col.startswith('HWParam'):
-                        continue  # Skip hardware params for now
-                    elif col.startswith('Eq') or col.startswith('PwrAmpEq'):
-                        category = 'EQ'
-                    elif col.startswith('Mod'):
-                        category = 'Modulation'
-                    elif col.startswith('Delay'):
-                        category = 'Delay'
-                    elif col.startswith('Reverb'):
-                        category = 'Reverb'
-                    elif col.startswith('Model'):
-                        category = 'Amp Model'
-                    elif col.startswith('Comp'):
-                        category = 'Compression'
-                    elif col.startswith('NoiseGate'):
-                        category = 'Noise Gate'
-                    elif col.startswith('Cab') or col.startswith('VIRCab'):
-                        category = 'Cabinet'
-                    else:
-                        category = 'Other'
-
-                    if category not in differences:
-                        differences[category] = []
-                    differences[category].append((col, val1, val2))
+    for i in np.flatnonzero(changed).tolist():
+        col = columns[i]
+
+        # Skip GUID and similar unique identifiers
+        if col in _COMPARE_SKIP:
+            continue
+
+        category = col_categories[i]
+        if category in _HW_CATEGORIES:
+            continue  # Skip hardware params for now
+
+        if category not in differences:
+            differences[category] = []
+        differences[category].append((col, val1[i], val2[i]))
 
     return differences
 
 
-def display_preset_params(columns: List[str], data: List[str], preset_name: str):
-    """Display key parameters for a preset"""
-    param_map = dict(zip(columns, data))
+class _ParamMap(dict):
+    """Column -> value map that renders missing columns as 'N/A'"""
+
+    def __missing__(self, key):
+        return 'N/A'
+
+
+# Sections printed by display_preset_params, in order. Each entry is
+# (only_if, template): templates name their columns as format fields, and
+# only_if is None or a (column, value) pair the preset must match.
+_DISPLAY_SECTIONS = (
+    (None,
+     "\n## METADATA\n"
+     "  Category: {Tag_ModelCategory}\n"
+     "  Genre: {Tag_Genre}\n"
+     "  Description: {Tag_Description}"),
+    (None,
+     "\n## AMP MODEL SETTINGS (Main tone controls)\n"
+     "  ModelEnable: {ModelEnable} (1=on, 0=off)\n"
+     "  ModelMix: {ModelMix}% (wet/dry blend)\n"
+     "  ModelGain: {ModelGain} (input gain/drive)\n"
+     "  ModelVolume: {ModelVolume} (output level)\n"
+     "  PwrAmpEqPresence: {PwrAmpEqPresence} (high-end clarity)\n"
+     "  PwrAmpEqDepth: {PwrAmpEqDepth} (low-end resonance)"),
+    (None,
+     "\n## EQ (Tone shaping)\n"
+     "  EqPost: {EqPost} (0=pre-amp, 1=post-amp)\n"
+     "  EqBass: {EqBass} @ {EqBassFreq} Hz\n"
+     "  EqMid: {EqMid} @ {EqMidFreq} Hz (Q: {EqMidQ})\n"
+     "  EqTreble: {EqTreble} @ {EqTrebleFreq} Hz"),
+    (None,
+     "\n## COMPRESSION\n"
+     "  CompEnable: {CompEnable}\n"
+     "  CompThreshold: {CompThreshold} dB\n"
+     "  CompMakeUp: {CompMakeUp} dB\n"
+     "  CompAttack: {CompAttack} ms"),
+    (None,
+     "\n## NOISE GATE\n"
+     "  NoiseGateEnable: {NoiseGateEnable}\n"
+     "  NoiseGateThreshold: {NoiseGateThreshold} dB\n"
+     "  NoiseGateRelease: {NoiseGateRelease} ms\n"
+     "  NoiseGateDepth: {NoiseGateDepth} dB"),
+    (None,
+     "\n## MODULATION\n"
+     "  ModEnable: {ModEnable}\n"
+     "  ModModel: {ModModel} (0=chorus, 1=tremolo, 2=phaser, 3=flanger, 4=rotary)"),
+    (('ModModel', '0'),  # Chorus
+     "  Chorus Rate: {ModChorusRate}\n"
+     "  Chorus Depth: {ModChorusDepth}\n"
+     "  Chorus Level: {ModChorusLevel}"),
+    (None,
+     "\n## DELAY\n"
+     "  DelayEnable: {DelayEnable}\n"
+     "  DelayModel: {DelayModel} (0=digital, 1=tape)\n"
+     "  DelayDigitalTime: {DelayDigitalTime} ms\n"
+     "  DelayDigitalFeedback: {DelayDigitalFeedback}%\n"
+     "  DelayDigitalMix: {DelayDigitalMix}%"),
+    (None,
+     "\n## REVERB\n"
+     "  ReverbEnable: {ReverbEnable}\n"
+     "  ReverbModel: {ReverbModel} (4=spring, 5=room, 6=plate)\n"
+     "  ReverbPosition: {ReverbPosition} (0=pre, 1=post)"),
+    (None,
+     "\n## CABINET\n"
+     "  CabType: {CabType} (0=VIR, 2=classic)\n"
+     "  VIRCabModel: {VIRCabModel}\n"
+     "  VIRCabMic1Model: {VIRCabMic1Model}\n"
+     "  VIRCabMicBlend: {VIRCabMicBlend}"),
+)
+
+
+# Every column read by a display template or condition
+_DISPLAY_KEYS = frozenset(
+    [field for _, template in _DISPLAY_SECTIONS
+     for _, field, _, _ in string.Formatter().parse(template) if field]
+    + [only_if[0] for only_if, _ in _DISPLAY_SECTIONS if only_if]
+)
+
+
+def _build_display_indices(columns: List[str]) -> Dict[str, int]:
+    """Map each displayed column to its index in columns"""
+    return {col: i for i, col in enumerate(columns) if col in _DISPLAY_KEYS}
+
+
+def display_preset_params(columns: List[str], data: List[str], preset_name: str,
+                          display_indices: Optional[Dict[str, int]] = None):
+    """
+    Display key parameters for a preset
+
+    display_indices is the result of _build_display_indices(columns); pass
+    it in when displaying many presets to compute it only once.
+    """
+    if display_indices is None:
+        display_indices = _build_display_indices(columns)
+    width = len(data)
+    param_map = _ParamMap((col, data[i]) for col, i in display_indices.items() if i < width)
 
     print(f"\n{'='*80}")
     print(f"PRESET: {preset_name}")
     print(f"{'='*80}")
 
-    # Metadata
-    print("\n## METADATA")
-    print(f"  Category: {param_map.get('Tag_ModelCategory', 'N/A')}")
-    print(f"  Genre: {param_map.get('Tag_Genre', 'N/A')}")
-    print(f"  Description: {param_map.get('Tag_Description', 'N/A')}")
-
-    # Amp Model Settings
-    print("\n## AMP MODEL SETTINGS (Main tone controls)")
-    print(f"  ModelEnable: {param_map.get('ModelEnable', 'N/A')} (1=on, 0=off)")
-    print(f"  ModelMix: {param_map.get('ModelMix', 'N/A')}% (wet/dry blend)")
-    print(f"  ModelGain: {param_map.get('ModelGain', 'N/A')} (input gain/drive)")
-    print(f"  ModelVolume: {param_map.get('ModelVolume', 'N/A')} (output level)")
-    print(f"  PwrAmpEqPresence: {param_map.get('PwrAmpEqPresence', 'N/A')} (high-end clarity)")
-    print(f"  PwrAmpEqDepth: {param_map.get('PwrAmpEqDepth', 'N/A')} (low-end resonance)")
-
-    # EQ
-    print("\n## EQ (Tone shaping)")
-    print(f"  EqPost: {param_map.get('EqPost', 'N/A')} (0=pre-amp, 1=post-amp)")
-    print(f"  EqBass: {param_map.get('EqBass', 'N/A')} @ {param_map.get('EqBassFreq', 'N/A')} Hz")
-    print(f"  EqMid: {param_map.get('EqMid', 'N/A')} @ {param_map.get('EqMidFreq', 'N/A')} Hz (Q: {param_map.get('EqMidQ', 'N/A')})")
-    print(f"  EqTreble: {param_map.get('EqTreble', 'N/A')} @ {param_map.get('EqTrebleFreq', 'N/A')} Hz")
-
-    # Compression
-    print("\n## COMPRESSION")
-    print(f"  CompEnable: {param_map.get('CompEnable', 'N/A')}")
-    print(f"  CompThreshold: {param_map.get('CompThreshold', 'N/A')} dB")
-    print(f"  CompMakeUp: {param_map.get('CompMakeUp', 'N/A')} dB")
-    print(f"  CompAttack: {param_map.get('CompAttack', 'N/A')} ms")
-
-    # Noise Gate
-    print("\n## NOISE GATE")
-    print(f"  NoiseGateEnable: {param_map.get('NoiseGateEnable', 'N/A')}")
-    print(f"  NoiseGateThreshold: {param_map.get('NoiseGateThreshold', 'N/A')} dB")
-    print(f"  NoiseGateRelease: {param_map.get('NoiseGateRelease', 'N/A')} ms")
-    print(f"  NoiseGateDepth: {param_map.get('NoiseGateDepth', 'N/A')} dB")
-
-    # Modulation
-    print("\n## MODULATION")
-    print(f"  ModEnable: {param_map.get('ModEnable', 'N/A')}")
-    print(f"  ModModel: {param_map.get('ModModel', 'N/A')} (0=chorus, 1=tremolo, 2=phaser, 3=flanger, 4=rotary)")
-    if param_map.get('ModModel') == '0':  # Chorus
-        print(f"  Chorus Rate: {param_map.get('ModChorusRate', 'N/A')}")
-        print(f"  Chorus Depth: {param_map.get('ModChorusDepth', 'N/A')}")
-        print(f"  Chorus Level: {param_map.get('ModChorusLevel', 'N/A')}")
-
-    # Delay
-    print("\n## DELAY")
-    print(f"  DelayEnable: {param_map.get('DelayEnable', 'N/A')}")
-    print(f"  DelayModel: {param_map.get('DelayModel', 'N/A')} (0=digital, 1=tape)")
-    print(f"  DelayDigitalTime: {param_map.get('DelayDigitalTime', 'N/A')} ms")
-    print(f"  DelayDigitalFeedback: {param_map.get('DelayDigitalFeedback', 'N/A')}%")
-    print(f"  DelayDigitalMix: {param_map.get('DelayDigitalMix', 'N/A')}%")
-
-    # Reverb
-    print("\n## REVERB")
-    print(f"  ReverbEnable: {param_map.get('ReverbEnable', 'N/A')}")
-    print(f"  ReverbModel: {param_map.get('ReverbModel', 'N/A')} (4=spring, 5=room, 6=plate)")
-    print(f"  ReverbPosition: {param_map.get('ReverbPosition', 'N/A')} (0=pre, 1=post)")
-
-    # Cabinet
-    print("\n## CABINET")
-    print(f"  CabType: {param_map.get('CabType', 'N/A')} (0=VIR, 2=classic)")
-    print(f"  VIRCabModel: {param_map.get('VIRCabModel', 'N/A')}")
-    print(f"  VIRCabMic1Model: {param_map.get('VIRCabMic1Model', 'N/A')}")
-    print(f"  VIRCabMicBlend: {param_map.get('VIRCabMicBlend', 'N/A')}")
+    for only_if, template in _DISPLAY_SECTIONS:
+        if only_if is None or param_map.get(only_if[0]) == only_if[1]:
+            print(template.format_map(param_map))
 
 
 def main():
@@ -197,6 +278,7 @@ def main():
         schema_line = f.read().strip()
 
     columns = parse_schema(schema_line)
+    col_categories = _build_column_categories(columns)
     print(f"Found {len(columns)} columns in schema")
 
     # Categorize parameters
@@ -207,8 +289,7 @@ def main():
     print("="*80)
 
     # Show non-HW parameters
-    for cat_name in ['Metadata', 'Amp Model', 'EQ', 'Compression', 'Noise Gate',
-                     'Modulation', 'Delay', 'Reverb', 'Cabinet', 'Other']:
+    for cat_name in _LISTED_CATEGORIES:
         params = categories[cat_name]
         if params:
             print(f"\n{cat_name} ({len(params)} params):")
@@ -225,18 +306,21 @@ def main():
     print("READING PRESET DATA")
     print("="*80)
 
-    with open(data_file, 'r') as f:
-        data_lines = [line for line in f.readlines() if line.strip()]
-
+    # Parse rows as they are read rather than loading the whole dump first;
+    # csv splits the tab-separated fields in C (blank lines come back empty)
     presets = []
-    for line in data_lines:
-        data = parse_data_row(line)
-        if len(data) >= 5:  # At least has preset name
-            preset_name = data[4] if len(data) > 4 else 'Unknown'
-            presets.append((preset_name, data))
+    with open(data_file, 'r', newline='') as f:
+        rows = csv.reader(map(str.strip, f), **_TSV_FORMAT)
+        for data in rows:
+            if len(data) >= 5:  # At least has preset name
+                preset_name = data[4] if len(data) > 4 else 'Unknown'
+                presets.append((preset_name, data))
 
     print(f"Found {len(presets)} presets")
 
+    # All presets as one (presets x columns) array for vectorized comparison
+    preset_matrix = _preset_matrix([data for _, data in presets], len(columns))
+
     # Display first preset in detail
     if presets:
         display_preset_params(columns, presets[0][1], presets[0][0])
@@ -247,8 +331,8 @@ def main():
         print(f"COMPARING: {presets[1][0]} vs {presets[2][0]}")
         print("="*80)
 
-        diffs = compare_presets(columns, presets[1][1], presets[2][1],
-                               presets[1][0], presets[2][0])
+        diffs = compare_presets(columns, preset_matrix[1], preset_matrix[2],
+                               presets[1][0], presets[2][0], col_categories)
 
         for category, changes in sorted(diffs.items()):
             if changes:
@@ -12,16 +12,27 @@ for table_def in cursor.fetchall():
     print(table_def[0])
     print("\n")
 
+# Column names and types for every table in one round-trip
+tables = ['Presets', 'ToneModels', 'ImpulseResponses']
+placeholders = ", ".join("?" * len(tables))
+cursor.execute(
+    "SELECT m.name, p.name, p.type FROM sqlite_master AS m "
+    "JOIN pragma_table_info(m.name) AS p "
+    f"WHERE m.type = 'table' AND m.name COLLATE NOCASE IN ({placeholders}) "
+    "ORDER BY m.name, p.cid",
+    tables
+)
+# SQLite table names are case-insensitive, so match them back the same way
+table_cols = {table.lower(): [] for table in tables}
+for table, col_name, col_type in cursor.fetchall():
+    table_cols[table.lower()].append((col_name, col_type))
+
 # For each table, get a sample row to see data types
-for table in ['Presets', 'ToneModels', 'ImpulseResponses']:
+for table in tables:
     cursor.execute(f"SELECT * FROM {table} LIMIT 1")
     row = cursor.fetchone()
-    cursor.execute(f"PRAGMA table_info({table})")
-    cols = cursor.fetchall()
-    
+
     print(f"\n{table}:")
-    for i, col in enumerate(cols):
-        col_name = col[1]
-        col_type = col[2]
+    for i, (col_name, col_type) in enumerate(table_cols[table.lower()]):
         sample_val = row[i] if row else None
         print(f"  {col_name} ({col_type}): {sample_val}")
\ No newline at end of file
@@ -15,11 +15,17 @@ Input file format:
 
 import re
 import sqlite3
-from typing import List, Tuple, Dict
+from typing import List, Tuple, Iterable, Iterator, Optional, Sequence
 from dataclasses import dataclass
 
+_COLUMN_LINE_RE = re.compile(r'^(AND|OR)?\s*\[([^\]]+)\]', re.IGNORECASE)
+_CONTAINS_RE = re.compile(r'\{CONTAINS\}\s*(.+?)\s*\{/CONTAINS\}', re.IGNORECASE)
 
-@dataclass
+# Columns shown for each matching preset by main()
+_DISPLAY_COLUMNS = ('Tag_PresetName', 'Tag_Artist', 'Tag_Album', 'Tag_Song')
+
+
+@dataclass(slots=True)
 class ColumnFilter:
     """Represents a filter for a single column"""
     column_name: str
@@ -39,6 +45,21 @@ class PresetSelector:
         self.db_path = db_path
         self.filters: List[ColumnFilter] = []
 
+        # Opened on first use by _connection(), then kept for reuse
+        self._conn = None
+
+    def close(self) -> None:
+        """Close the database connection, if one is open"""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
     def parse_filter_file(self, file_path: str) -> None:
         """
         Parse the filter criteria file
@@ -48,68 +69,67 @@ class PresetSelector:
         """
         self.filters = []
 
-        with open(file_path, 'r') as f:
-            lines = [line.rstrip('\n') for line in f.readlines()]
-
         current_column = None
         current_values = []
         current_partial = []
         next_operator = 'AND'  # Default operator
 
-        i = 0
-        while i < len(lines):
-            line = lines[i].strip()
-
-            # Skip empty lines
-            if not line:
-                i += 1
-                continue
-
-            # Check for column definition with optional leading operator
-            column_match = re.match(r'^(AND|OR)?\s*\[([^\]]+)\]', line, re.IGNORECASE)
-            if column_match:
-                # Save previous filter if exists
-                if current_column:
-                    self.filters.append(ColumnFilter(
-                        column_name=current_column,
-                        values=current_values,
-                        partial_matches=current_partial,
-                        operator=next_operator
-                    ))
-
-                # Start new filter
-                operator = column_match.group(1)
-                if operator:
-                    next_operator = operator.upper()
-                else:
-                    next_operator = 'AND'  # Default for first column or when not specified
-
-                current_column = column_match.group(2)
-                current_values = []
-                current_partial = []
-                i += 1
-                continue
-
-            # Check for CONTAINS markup
-            contains_match = re.match(r'\{CONTAINS\}\s*(.+?)\s*\{/CONTAINS\}', line, re.IGNORECASE)
-            if contains_match:
+        # Dispatch on the first character so each line costs at most one
+        # regex match: column headers start with '[' or a leading AND/OR,
+        # CONTAINS markup with '{', and anything else is a plain value
+        with open(file_path, 'r') as f:
+            for line in f:
+                line = line.strip()
+
+                # Skip empty lines
+                if not line:
+                    continue
+
+                c0 = line[0]
+                if c0 == '[' or c0 in 'AaOo':
+                    # Check for column definition with optional leading operator
+                    column_match = _COLUMN_LINE_RE.match(line)
+                    if column_match:
+                        # Save previous filter if exists
+                        if current_column:
+                            self.filters.append(ColumnFilter(
+                                column_name=current_column,
+                                values=current_values,
+                                partial_matches=current_partial,
+                                operator=next_operator
+                            ))
+
+                        # Start new filter
+                        operator = column_match.group(1)
+                        if operator:
+                            next_operator = operator.upper()
+                        else:
+                            next_operator = 'AND'  # Default for first column or when not specified
+
+                        current_column = column_match.group(2)
+                        current_values = []
+                        current_partial = []
+                        continue
+
+                    # Check for standalone AND/OR (applies to next column)
+                    if c0 != '[' and len(line) <= 3:
+                        keyword = line.upper()
+                        if keyword == 'AND' or keyword == 'OR':
+                            next_operator = keyword
+                            continue
+
+                elif c0 == '{':
+                    # Check for CONTAINS markup
+                    contains_match = _CONTAINS_RE.match(line)
+                    if contains_match:
+                        if current_column:
+                            current_partial.append(contains_match.group(1))
+                        continue
+
+                # Regular value
                 if current_column:
-                    current_partial.append(contains_match.group(1))
-                i += 1
-                continue
-
-            # Check for standalone AND/OR (applies to next column)
-            if line.upper() in ['AND', 'OR']:
-                next_operator = line.upper()
-                i += 1
-                continue
-
-            # Regular value
-            if current_column and line:
-                # Add the value as-is (including * if present)
-                current_values.append(line)
-
-            i += 1
+                    # Add the value as-is (including * if present)
+                    current_values.append(line)
 
         # Add the last filter
         if current_column:
@@ -120,33 +140,59 @@ class PresetSelector:
                 operator=next_operator
             ))
 
-    def build_sql_query(self, table_name: str = 'Presets') -> Tuple[str, List]:
+    def build_sql_query(self, table_name: str = 'Presets',
+                        columns: Optional[Sequence[str]] = None,
+                        limit: Optional[int] = None) -> Tuple[str, List]:
         """
         Build SQL query from parsed filters
 
         Args:
             table_name: Name of the table to query
+            columns: Columns to select (default: all columns)
+            limit: Maximum number of rows to return (default: no limit)
 
         Returns:
             Tuple of (sql_query, parameters)
         """
+        select_list = ", ".join(f"[{c}]" for c in columns) if columns else "*"
+        sql = f"SELECT {select_list} FROM {table_name}"
+
+        where_clause, parameters = self._build_where_clause()
+        if where_clause:
+            sql = f"{sql} WHERE {where_clause}"
+
+        if limit is not None:
+            sql = f"{sql} LIMIT ?"
+            parameters.append(limit)
+
+        return sql, parameters
+
+    def _build_where_clause(self) -> Tuple[str, List]:
+        """
+        Build the WHERE clause (without the keyword) from parsed filters
+
+        Returns:
+            Tuple of (where_clause, parameters); where_clause is empty when
+            there are no filters
+        """
         if not self.filters:
-            return f"SELECT * FROM {table_name}", []
+            return "", []
 
         where_clauses = []
         parameters = []
 
-        for i, filter_obj in enumerate(self.filters):
-            column_conditions = []
+        for filter_obj in self.filters:
+            column = f"[{filter_obj.column_name}]"
 
             # Add exact match conditions
-            for value in filter_obj.values:
-                column_conditions.append(f"[{filter_obj.column_name}] = ?")
-                parameters.append(value)
+            exact = f"{column} = ?"
+            column_conditions = [exact] * len(filter_obj.values)
+            parameters.extend(filter_obj.values)
 
             # Add partial match conditions (LIKE)
+            like = f"{column} LIKE ?"
             for partial in filter_obj.partial_matches:
-                column_conditions.append(f"[{filter_obj.column_name}] LIKE ?")
+                column_conditions.append(like)
                 parameters.append(f"%{partial}%")
 
             # Combine conditions for this column with OR
@@ -154,42 +200,99 @@ class PresetSelector:
                 column_clause = "(" + " OR ".join(column_conditions) + ")"
                 where_clauses.append(column_clause)
 
-        # Combine all column clauses with their operators
-        if len(where_clauses) == 1:
-            where_clause = where_clauses[0]
-        else:
-            # Build the WHERE clause respecting operators
-            combined = where_clauses[0]
-            for i in range(1, len(where_clauses)):
-                operator = self.filters[i].operator
-                combined = f"{combined} {operator} {where_clauses[i]}"
-            where_clause = combined
-
-        sql = f"SELECT * FROM {table_name} WHERE {where_clause}"
-        return sql, parameters
+        # Combine all column clauses with their operators, joining once at
+        # the end rather than re-copying the growing clause per filter
+        parts = [where_clauses[0]]
+        for i in range(1, len(where_clauses)):
+            parts.append(self.filters[i].operator)
+            parts.append(where_clauses[i])
+
+        return " ".join(parts), parameters
 
-    def execute_query(self) -> List[Dict]:
+    def _connection(self) -> sqlite3.Connection:
+        """Return the database connection, opening it on first use"""
+        if not self.db_path:
+            raise ValueError("Database path not set")
+
+        # One connection until close(); sqlite3 keeps its own statement
+        # cache per connection, so reissued queries skip re-parsing
+        if self._conn is None:
+            conn = sqlite3.connect(self.db_path)
+            try:
+                conn.row_factory = sqlite3.Row  # Enable column access by name
+                conn.execute('PRAGMA query_only = ON')
+                conn.execute('PRAGMA cache_size = -65536')  # 64 MiB page cache
+            except sqlite3.Error:
+                conn.close()
+                raise
+            self._conn = conn
+        return self._conn
+
+    def execute_query(self, columns: Optional[Sequence[str]] = None, limit: Optional[int] = None,
+                      table_name: str = 'Presets') -> Iterator[sqlite3.Row]:
         """
         Execute the query against the database
 
+        Errors (no database path, SQL errors) are raised by this call; the
+        returned cursor then reads records lazily as it is iterated.
+
+        Args:
+            columns: Columns to fetch (default: all); names not present in
+                the table are skipped
+            limit: Maximum number of records to fetch (default: no limit)
+            table_name: Name of the table to query
+
         Returns:
-            List of matching records as dictionaries
+            Iterator over matching records as sqlite3.Row objects (access
+            values by column name)
         """
-        if not self.db_path:
-            raise ValueError("Database path not set")
+        conn = self._connection()
 
-        sql, params = self.build_sql_query()
+        if columns:
+            existing = {row[1] for row in conn.execute(f"PRAGMA table_info([{table_name}])")}
+            columns = [c for c in columns if c in existing]
+
+        sql, params = self.build_sql_query(table_name, columns, limit)
+        return conn.execute(sql, params)
+
+    def execute_many(self, param_variants: Iterable[Sequence],
+                     table_name: str = 'Presets') -> Iterator[List[sqlite3.Row]]:
+        """
+        Run the query once per parameter set, reusing the same SQL
+
+        The SQL is built once from the current filters, so every parameter
+        set must match their shape: one value per exact match and one LIKE
+        pattern (e.g. '%value%') per partial match, in filter order.
 
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row  # Enable column access by name
-        cursor = conn.cursor()
+        A missing database path is raised by this call; each parameter set
+        is then executed as the returned iterator is advanced.
 
-        try:
-            cursor.execute(sql, params)
-            results = [dict(row) for row in cursor.fetchall()]
-            return results
-        finally:
-            conn.close()
+        Args:
+            param_variants: Parameter sets to bind, one per execution
+            table_name: Name of the table to query
+
+        Returns:
+            Iterator over the matching records for each parameter set, in order
+        """
+        conn = self._connection()
+        sql, _ = self.build_sql_query(table_name)
+        return (conn.execute(sql, params).fetchall() for params in param_variants)
+
+    def count_matches(self, table_name: str = 'Presets') -> int:
+        """
+        Count the records matching the parsed filters
+
+        Args:
+            table_name: Name of the table to query
+
+        Returns:
+            Number of matching records
+        """
+        sql = f"SELECT COUNT(*) FROM {table_name}"
+        where_clause, params = self._build_where_clause()
+        if where_clause:
+            sql = f"{sql} WHERE {where_clause}"
+        return self._connection().execute(sql, params).fetchone()[0]
 
     def print_query(self) -> None:
         """Print the generated SQL query (for debugging)"""
@@ -237,51 +340,54 @@ def main():
     args = parser.parse_args()
 
     # Create selector and parse file
-    selector = PresetSelector(args.database)
-    selector.parse_filter_file(args.filter_file)
-
-    print(f"Parsed {len(selector.filters)} filter(s):")
-    for i, f in enumerate(selector.filters, 1):
-        print(f"\n{i}. Column: [{f.column_name}]")
-        if f.values:
-            print(f"   Exact matches: {f.values}")
-        if f.partial_matches:
-            print(f"   Partial matches: {f.partial_matches}")
-        if i < len(selector.filters):
-            print(f"   Operator to next filter: {f.operator}")
-    print()
-
-    # Show query if requested
-    if args.show_query or not args.execute:
-        selector.print_query()
-
-    # Execute query if requested
-    if args.execute:
-        if not args.database:
-            print("\nError: --database required for execution")
-            return
-
-        try:
-            results = selector.execute_query()
-            print(f"\nFound {len(results)} matching preset(s)")
-
-            # Display results
-            if results:
-                display_limit = args.limit if args.limit else len(results)
-                for i, record in enumerate(results[:display_limit], 1):
-                    print(f"\n{i}. {record.get('Tag_PresetName', 'N/A')}")
-                    if 'Tag_Artist' in record:
+    with PresetSelector(args.database) as selector:
+        selector.parse_filter_file(args.filter_file)
+
+        print(f"Parsed {len(selector.filters)} filter(s):")
+        for i, f in enumerate(selector.filters, 1):
+            print(f"\n{i}. Column: [{f.column_name}]")
+            if f.values:
+                print(f"   Exact matches: {f.values}")
+            if f.partial_matches:
+                print(f"   Partial matches: {f.partial_matches}")
+            if i < len(selector.filters):
+                print(f"   Operator to next filter: {f.operator}")
+        print()
+
+        # Show query if requested
+        if args.show_query or not args.execute:
+            selector.print_query()
+
+        # Execute query if requested
+        if args.execute:
+            if not args.database:
+                print("\nError: --database required for execution")
+                return
+
+            try:
+                # Only fetch the displayed columns, and only as many rows as shown
+                limit = args.limit or None
+                results = selector.execute_query(columns=_DISPLAY_COLUMNS, limit=limit)
+                total = selector.count_matches()
+                print(f"\nFound {total} matching preset(s)")
+
+                # Display results
+                for i, record in enumerate(results, 1):
+                    fields = record.keys()
+                    name = record['Tag_PresetName'] if 'Tag_PresetName' in fields else 'N/A'
+                    print(f"\n{i}. {name}")
+                    if 'Tag_Artist' in fields:
                         print(f"   Artist: {record['Tag_Artist']}")
-                    if 'Tag_Album' in record:
+                    if 'Tag_Album' in fields:
                         print(f"   Album: {record['Tag_Album']}")
-                    if 'Tag_Song' in record:
+                    if 'Tag_Song' in fields:
                         print(f"   Song: {record['Tag_Song']}")
 
-                if args.limit and len(results) > args.limit:
-                    print(f"\n... and {len(results) - args.limit} more")
+                if limit and total > limit:
+                    print(f"\n... and {total - limit} more")
 
-        except Exception as e:
-            print(f"\nError executing query: {e}")
+            except Exception as e:
+                print(f"\nError executing query: {e}")
 
 
 if __name__ == '__main__':